@@ -1,36 +1,118 @@
+from contextlib import contextmanager
 from pathlib import Path as P
+import os
 import shutil
 import tempfile
 from textwrap import dedent
+from typing import Iterator, Set
 
 import click
-from kapitan.resources import inventory_reclass
 
 from commodore.config import Config
 from commodore.component import Component
 from commodore.dependency_mgmt import fetch_jsonnet_libraries
-from commodore.helpers import kapitan_compile, relsymlink
+from commodore.helpers import kapitan_compile, kapitan_inventory, relsymlinks
 from commodore.inventory import Inventory
 from commodore.postprocess import postprocess_components
 
 
+# Fake inventory templates, dedented once at import time and filled in with
+# %-formatting
+_PARAMS_TEMPLATE = dedent(
+    """
+    parameters:
+      cloud:
+        provider: ${facts:cloud}
+        region: ${facts:region}
+      cluster:
+        catalog_url: ssh://git@git.example.com/org/repo.git
+        dist: test-distribution
+        name: c-green-test-1234
+        tenant: t-silent-test-1234
+      customer:
+        name: ${cluster:tenant}
+      facts:
+        distribution: test-distribution
+        cloud: cloudscale
+        region: rma1
+      argocd:
+        namespace: test
+
+      kapitan:
+        vars:
+            target: %(component_name)s
+            namespace: test"""
+)
+
+_TARGET_TEMPLATE = dedent(
+    """
+    classes:
+    - params.%(bootstrap_target)s
+    - defaults.%(component_name)s
+    - components.%(component_name)s
+    %(value_classes)s"""
+)
+
+_ARGOCD_LIB = dedent(
+    """
+    local ArgoApp(component, namespace, project='', secrets=true) = {};
+    local ArgoProject(name) = {};
+
+    {
+      App: ArgoApp,
+      Project: ArgoProject,
+    }"""
+)
+
+
+@contextmanager
+def _temp_workspace(
+    config: Config, component_path: P, output_path: P
+) -> Iterator[P]:
+    """
+    Create a temporary workspace and remove it again when leaving the context.
+
+    The workspace is created next to the compile output instead of in the global
+    temp dir, so it's on the same filesystem as the output. If that location is
+    inside the component repository, we fall back to the global temp dir, as the
+    workspace symlinks the component and must not end up inside it. With trace
+    output enabled, the workspace is left in place for inspection.
+    """
+    workspace_dir = output_path.parent
+    if workspace_dir == component_path or component_path in workspace_dir.parents:
+        workspace_dir = None
+    else:
+        workspace_dir.mkdir(parents=True, exist_ok=True)
+    temp_dir = P(
+        os.path.realpath(tempfile.mkdtemp(prefix="component-", dir=workspace_dir))
+    )
+    try:
+        yield temp_dir
+    finally:
+        if config.trace:
+            click.echo(f" > Temp dir left in place {temp_dir}")
+        else:
+            if config.debug:
+                click.echo(f" > Remove temp dir {temp_dir}")
+            shutil.rmtree(temp_dir)
+
+
 def compile_component(
     config: Config, component_path, value_files, search_paths, output_path
 ):
     # Resolve all input to absolute paths to fix symlinks
-    component_path = P(component_path).resolve()
-    value_files = [P(f).resolve() for f in value_files]
-    search_paths = [P(d).resolve() for d in search_paths]
+    component_path = P(os.path.realpath(component_path))
+    value_files = [P(os.path.realpath(f)) for f in value_files]
+    search_paths = [P(os.path.realpath(d)) for d in search_paths]
     search_paths.append(component_path / "vendor")
-    output_path = P(output_path).resolve()
+    output_path = P(os.path.realpath(output_path))
     # Ignore 'component-' prefix in dir name
     component_name = component_path.stem.replace("component-", "")
 
     click.secho(f"Compile component {component_name}...", bold=True)
 
-    temp_dir = P(tempfile.mkdtemp(prefix="component-")).resolve()
-    config.work_dir = temp_dir
-    try:
+    with _temp_workspace(config, component_path, output_path) as temp_dir:
+        config.work_dir = temp_dir
         if config.debug:
             click.echo(f"   > Created temp workspace: {config.work_dir}")
         inv = config.inventory
@@ -40,69 +122,33 @@ def compile_component(
         config.register_component(component)
         _prepare_fake_inventory(inv, component, value_files)
 
-        # Create class for fake parameters
-        with open(inv.params_file, "w") as file:
-            file.write(
-                dedent(
-                    f"""
-                parameters:
-                  cloud:
-                    provider: ${{facts:cloud}}
-                    region: ${{facts:region}}
-                  cluster:
-                    catalog_url: ssh://git@git.example.com/org/repo.git
-                    dist: test-distribution
-                    name: c-green-test-1234
-                    tenant: t-silent-test-1234
-                  customer:
-                    name: ${{cluster:tenant}}
-                  facts:
-                    distribution: test-distribution
-                    cloud: cloudscale
-                    region: rma1
-                  argocd:
-                    namespace: test
-
-                  kapitan:
-                    vars:
-                        target: {component_name}
-                        namespace: test"""
-                )
-            )
-
-        # Create test target
-        with open(inv.target_file(component), "w") as file:
-            value_classes = "\n".join([f"- {c.stem}" for c in value_files])
-            file.write(
-                dedent(
-                    f"""
-                classes:
-                - params.{inv.bootstrap_target}
-                - defaults.{component_name}
-                - components.{component_name}
-                {value_classes}"""
-                )
-            )
-
-        # Fake Argo CD lib
-        # We plug "fake" Argo CD library here because every component relies on it
-        # and we don't want to provide it every time when compiling a single component.
-        with open(inv.lib_dir / "argocd.libjsonnet", "w") as file:
-            file.write(
-                dedent(
-                    """
-                local ArgoApp(component, namespace, project='', secrets=true) = {};
-                local ArgoProject(name) = {};
-
-                {
-                  App: ArgoApp,
-                  Project: ArgoProject,
-                }"""
-                )
-            )
+        value_classes = "\n".join(f"- {c.stem}" for c in value_files)
+        fake_inventory_files = [
+            # Create class for fake parameters
+            (
+                inv.params_file,
+                _PARAMS_TEMPLATE % {"component_name": component_name},
+            ),
+            # Create test target
+            (
+                inv.target_file(component),
+                _TARGET_TEMPLATE
+                % {
+                    "bootstrap_target": inv.bootstrap_target,
+                    "component_name": component_name,
+                    "value_classes": value_classes,
+                },
+            ),
+            # Fake Argo CD lib
+            # We plug "fake" Argo CD library here because every component relies on it
+            # and we don't want to provide it every time when compiling a single component.
+            (inv.lib_dir / "argocd.libjsonnet", _ARGOCD_LIB),
+        ]
+        for path, content in fake_inventory_files:
+            path.write_text(content)
 
         # Render jsonnetfile.jsonnet if necessary
-        nodes = inventory_reclass(inv.inventory_dir)["nodes"]
+        nodes = kapitan_inventory(config)
         component_params = nodes[component_name]["parameters"].get(
             component_name.replace("-", "_"), {}
         )
@@ -118,6 +164,7 @@ def compile_component(
             search_paths=search_paths,
             fake_refs=True,
             reveal=True,
+            reuse_inventory=True,
         )
         click.echo(
             f" > Component compiled to {output_path / 'compiled' / component_name}"
@@ -126,37 +173,47 @@ def compile_component(
         # prepare inventory and fake component object for postprocess
         config.work_dir = output_path
         postprocess_components(config, nodes, config.get_components())
-    finally:
-        if config.trace:
-            click.echo(f" > Temp dir left in place {temp_dir}")
-        else:
-            if config.debug:
-                click.echo(f" > Remove temp dir {temp_dir}")
-            shutil.rmtree(temp_dir)
+
+
+def _scan_component_files(class_dir: P) -> Set[str]:
+    """
+    Return the names of all files in the component class directory `class_dir`.
+
+    Listing the directory once is cheaper than checking for the class and
+    defaults files individually.
+    """
+    try:
+        with os.scandir(class_dir) as entries:
+            return {e.name for e in entries if e.is_file()}
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
 
 
 def _prepare_fake_inventory(inv: Inventory, component: Component, value_files):
+    # Component paths are computed on every property access, look them up once
+    component_name = component.name
+    component_dir = component.target_directory
     component_class_file = component.class_file
     component_defaults_file = component.defaults_file
-    if not component_class_file.exists():
+    component_files = _scan_component_files(component_class_file.parent)
+    if component_class_file.name not in component_files:
         raise click.ClickException(
             f"Could not find component class file: {component_class_file}"
         )
-    if not component_defaults_file.exists():
+    if component_defaults_file.name not in component_files:
         raise click.ClickException(
             f"Could not find component default file: {component_defaults_file}"
         )
 
-    # Create class symlink
-    relsymlink(component_class_file, inv.components_dir)
-    # Create defaults symlink
-    relsymlink(
-        component_defaults_file,
-        inv.defaults_dir,
-        dest_name=f"{component.name}.yml",
+    relsymlinks(
+        [
+            # Create class symlink
+            (component_class_file, inv.components_dir, None),
+            # Create defaults symlink
+            (component_defaults_file, inv.defaults_dir, f"{component_name}.yml"),
+            # Create component symlink
+            (component_dir, inv.dependencies_dir, component_name),
+        ]
+        # Create value symlinks
+        + [(file, inv.classes_dir, None) for file in value_files]
     )
-    # Create component symlink
-    relsymlink(component.target_directory, inv.dependencies_dir, component.name)
-    # Create value symlinks
-    for file in value_files:
-        relsymlink(file.parent / file.name, inv.classes_dir)
@@ -16,7 +16,8 @@ class Config:
     _components: Dict[str, Component]
     _config_repos: Dict[str, Repo]
     _component_aliases: Dict[str, str]
-    _deprecation_notices: List[str]
+    # Insertion-ordered set of deprecation notices
+    _deprecation_notices_set: Dict[str, None]
 
     # pylint: disable=too-many-arguments
     def __init__(
@@ -44,7 +45,7 @@ class Config:
         self.force = False
         self.fetch_dependencies = True
         self._inventory = Inventory(work_dir=self.work_dir)
-        self._deprecation_notices = []
+        self._deprecation_notices_set = {}
         self._global_repo_revision_override = None
         self._tenant_repo_revision_override = None
 
@@ -162,8 +163,12 @@ class Config:
                     f"Component {cn} with alias {alias} does not support instantiation."
                 )
 
+    @property
+    def _deprecation_notices(self) -> List[str]:
+        return list(self._deprecation_notices_set)
+
     def register_deprecation_notice(self, notice: str):
-        self._deprecation_notices.append(notice)
+        self._deprecation_notices_set[notice] = None
 
     def print_deprecation_notices(self):
         tw = textwrap.TextWrapper(
@@ -174,9 +179,9 @@ class Config:
             initial_indent=" > ",
             subsequent_indent="   ",
         )
-        if len(self._deprecation_notices) > 0:
+        if len(self._deprecation_notices_set) > 0:
             click.secho("\nCommodore notices:", bold=True)
-            for notice in self._deprecation_notices:
+            for notice in self._deprecation_notices_set:
                 notice = tw.fill(notice)
                 click.secho(notice)
 
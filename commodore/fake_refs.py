@@ -0,0 +1,11 @@
+from kapitan.refs.base import PlainRef
+from kapitan.refs.secrets.vaultkv import VaultBackend
+
+
+class FakeVaultBackend(VaultBackend):
+    def __init__(self):
+        "init FakeVaultBackend ref backend type"
+        super().__init__(None)
+
+    def __getitem__(self, ref_path):
+        return PlainRef(ref_path)
@@ -3,7 +3,7 @@ import json
 import shutil
 import os
 from pathlib import Path as P
-from typing import Callable, Dict, Iterable, Optional
+from typing import Callable, Dict, Iterable, Optional, Tuple
 
 import click
 import requests
@@ -12,13 +12,6 @@ import yaml
 # pylint: disable=redefined-builtin
 from requests.exceptions import ConnectionError, HTTPError
 from url_normalize import url_normalize
-from kapitan import cached
-from kapitan import targets as kapitan_targets
-from kapitan import defaults
-from kapitan.cached import reset_cache as reset_reclass_cache
-from kapitan.refs.base import RefController, PlainRef
-from kapitan.refs.secrets.vaultkv import VaultBackend
-from kapitan.resources import inventory_reclass
 
 from commodore import __install_dir__
 from commodore.config import Config
@@ -27,15 +20,6 @@ from commodore.config import Config
 ArgumentCache = collections.namedtuple("ArgumentCache", ["inventory_path"])
 
 
-class FakeVaultBackend(VaultBackend):
-    def __init__(self):
-        "init FakeVaultBackend ref backend type"
-        super().__init__(None)
-
-    def __getitem__(self, ref_path):
-        return PlainRef(ref_path)
-
-
 class ApiError(Exception):
     pass
 
@@ -144,7 +128,29 @@ def kapitan_compile(
     fake_refs=False,
     fetch_dependencies=True,
     reveal=False,
+    reuse_inventory=False,
 ):
+    """
+    Compile `targets` with Kapitan.
+
+    By default, Kapitan's cached inventory is reset, so Kapitan renders the
+    inventory itself. Callers may pass `reuse_inventory=True` to compile with
+    the cached inventory instead, but only if they've just rendered the same
+    inventory with `kapitan_inventory(config)` and haven't modified the
+    inventory since. Otherwise, the targets are compiled from a stale
+    inventory.
+    """
+    # Kapitan is imported on first use, so that commands which never call
+    # into Kapitan don't pay for importing it.
+    # pylint: disable=import-outside-toplevel
+    from kapitan import cached
+    from kapitan import targets as kapitan_targets
+    from kapitan import defaults
+    from kapitan.cached import reset_cache as reset_reclass_cache
+    from kapitan.refs.base import RefController
+
+    from commodore.fake_refs import FakeVaultBackend
+
     if not output_dir:
         output_dir = config.work_dir
 
@@ -154,7 +160,10 @@ def kapitan_compile(
         config.work_dir,
         __install_dir__,
     ]
-    reset_reclass_cache()
+    # Reusing the inventory rendered by a preceding `kapitan_inventory()` call
+    # saves Kapitan from rendering it a second time.
+    if not reuse_inventory:
+        reset_reclass_cache()
     refController = RefController(config.refs_dir)
     if fake_refs:
         refController.register_backend(FakeVaultBackend())
@@ -188,6 +197,10 @@ def kapitan_inventory(config: Config, key="nodes") -> Dict:
     Reset reclass cache and render inventory.
     Returns the top-level key according to the kwarg.
     """
+    # pylint: disable=import-outside-toplevel
+    from kapitan.cached import reset_cache as reset_reclass_cache
+    from kapitan.resources import inventory_reclass
+
     reset_reclass_cache()
     inv = inventory_reclass(config.inventory.inventory_dir)
     return inv[key]
@@ -211,19 +224,62 @@ def rm_tree_contents(basedir):
             os.unlink(f)
 
 
+def _relpath(path: str, start: str) -> str:
+    """
+    Equivalent of `os.path.relpath(path, start=start)`.
+
+    For the common case of two absolute, normalized paths, the relative path
+    is computed by comparing path components directly, which skips the
+    normalization and splitting done by `os.path.relpath()`. Other inputs
+    are passed on to `os.path.relpath()`.
+    """
+    if not os.path.isabs(path) or not os.path.isabs(start) or start == os.sep:
+        return os.path.relpath(path, start=start)
+    path_parts = path.split(os.sep)
+    start_parts = start.split(os.sep)
+    for parts in (path_parts, start_parts):
+        rest = parts[1:]
+        if "" in rest or os.curdir in rest or os.pardir in rest:
+            return os.path.relpath(path, start=start)
+    i = 0
+    n = min(len(path_parts), len(start_parts))
+    while i < n and path_parts[i] == start_parts[i]:
+        i += 1
+    rel_parts = [os.pardir] * (len(start_parts) - i) + path_parts[i:]
+    if not rel_parts:
+        return os.curdir
+    return os.sep.join(rel_parts)
+
+
+# pylint: disable=unsubscriptable-object
+def relsymlinks(links: Iterable[Tuple[P, P, Optional[str]]]):
+    """
+    Create relative symlinks for all `(src, dest_dir, dest_name)` tuples in
+    `links`. If `dest_name` is None, the link is named after `src`.
+
+    Each distinct `dest_dir` is only made absolute once, which avoids
+    redundant path normalization when creating many links in the same
+    directory. Existing files at the link destination are replaced.
+    """
+    dest_dirs: Dict[P, str] = {}
+    for src, dest_dir, dest_name in links:
+        if dest_name is None:
+            dest_name = src.name
+        start = dest_dirs.get(dest_dir)
+        if start is None:
+            start = dest_dirs.setdefault(dest_dir, os.path.abspath(dest_dir))
+        # pathlib's relative_to() isn't suitable for this use case, since it only
+        # works for dropping a path's prefix according to the documentation. See
+        # https://docs.python.org/3/library/pathlib.html#pathlib.PurePath.relative_to
+        link_src = _relpath(os.fspath(src), start)
+        link_dst = os.path.join(start, dest_name)
+        try:
+            os.symlink(link_src, link_dst)
+        except FileExistsError:
+            os.remove(link_dst)
+            os.symlink(link_src, link_dst)
+
+
 # pylint: disable=unsubscriptable-object
 def relsymlink(src: P, dest_dir: P, dest_name: Optional[str] = None):
-    if dest_name is None:
-        dest_name = src.name
-    # pathlib's relative_to() isn't suitable for this use case, since it only
-    # works for dropping a path's prefix according to the documentation. See
-    # https://docs.python.org/3/library/pathlib.html#pathlib.PurePath.relative_to
-    link_src = os.path.relpath(src, start=dest_dir)
-    link_dst = dest_dir / dest_name
-    if not P(link_src).exists():
-        click.ClickException(
-            f"Can't link {link_src} to {link_dst}. Source does not exist."
-        )
-    if link_dst.exists():
-        os.remove(link_dst)
-    os.symlink(link_src, link_dst)
+    relsymlinks([(src, dest_dir, dest_name)])
@@ -91,12 +91,22 @@ class Inventory:
         return self.targets_dir / f"{_component_name(target)}.yml"
 
     def ensure_dirs(self):
-        makedirs(self.components_dir, exist_ok=True)
-        makedirs(self.defaults_dir, exist_ok=True)
-        makedirs(self.params_dir, exist_ok=True)
-        makedirs(self.lib_dir, exist_ok=True)
-        makedirs(self.libs_dir, exist_ok=True)
-        makedirs(self.targets_dir, exist_ok=True)
+        makedirs(self._work_dir, exist_ok=True)
+        dirs = {
+            self.inventory_dir,
+            self.classes_dir,
+            self.components_dir,
+            self.defaults_dir,
+            self.params_dir,
+            self.targets_dir,
+            self.dependencies_dir,
+            self.lib_dir,
+            self.libs_dir,
+        }
+        # Create shallow directories first, so that each directory's parent
+        # already exists and we issue exactly one mkdir per directory.
+        for d in sorted(dirs, key=lambda d: len(d.parts)):
+            d.mkdir(exist_ok=True)
 
 
 # pylint: disable=unsubscriptable-object
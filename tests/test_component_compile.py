@@ -13,7 +13,7 @@ from click import ClickException
 from git import Repo
 
 from commodore.config import Config
-from commodore.component.compile import compile_component
+from commodore.component.compile import compile_component, _temp_workspace
 from test_component_template import test_run_component_new_command
 
 
@@ -148,3 +148,39 @@ def test_no_component_compile_command(tmp_path):
     with pytest.raises(ClickException) as excinfo:
         compile_component(Config(tmp_path), tmp_path / "foo", [], [], "./")
     assert "Could not find component class file" in str(excinfo)
+
+
+def test_no_component_defaults_compile_command(tmp_path):
+    component_path = tmp_path / "foo"
+    Repo.init(component_path)
+    (component_path / "class").mkdir()
+    (component_path / "class" / "foo.yml").touch()
+    with pytest.raises(ClickException) as excinfo:
+        compile_component(Config(tmp_path), component_path, [], [], "./")
+    assert "Could not find component default file" in str(excinfo)
+
+
+@pytest.mark.parametrize("verbose,cleanup", [(0, True), (3, False)])
+def test_temp_workspace(tmp_path: P, verbose, cleanup):
+    config = Config(tmp_path, verbose=verbose)
+    component_path = tmp_path / "dependencies" / "test-component"
+    output_path = tmp_path / "output" / "test-component"
+    with _temp_workspace(config, component_path, output_path) as temp_dir:
+        assert temp_dir.is_dir()
+        assert temp_dir.parent == tmp_path / "output"
+        assert temp_dir.name.startswith("component-")
+    assert temp_dir.exists() != cleanup
+    assert not (tmp_path / ".cache").exists()
+
+
+@pytest.mark.parametrize("output", ["", "compiled"])
+def test_temp_workspace_outside_component(tmp_path: P, output):
+    config = Config(tmp_path)
+    component_path = tmp_path / "test-component"
+    output_path = component_path / output / "out"
+    with _temp_workspace(config, component_path, output_path) as temp_dir:
+        assert temp_dir.is_dir()
+        assert temp_dir.name.startswith("component-")
+        assert component_path not in temp_dir.parents
+    assert not temp_dir.exists()
+    assert not component_path.exists()
@@ -131,6 +131,13 @@ def test_register_deprecation_notices(config):
     assert ["test 1", "test 2"] == config._deprecation_notices
 
 
+def test_register_deprecation_notices_deduplicates(config):
+    _setup_deprecation_notices(config)
+    config.register_deprecation_notice("test 1")
+
+    assert ["test 1", "test 2"] == config._deprecation_notices
+
+
 def test_print_deprecation_notices_no_notices(config, capsys):
     config.print_deprecation_notices()
     captured = capsys.readouterr()
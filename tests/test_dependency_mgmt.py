@@ -13,7 +13,7 @@ from pathlib import Path
 from commodore import dependency_mgmt
 from commodore.config import Config
 from commodore.component import Component
-from commodore.helpers import relsymlink
+from commodore.helpers import relsymlink, relsymlinks
 from commodore.inventory import Inventory
 
 from bench_component import setup_components_upstream
@@ -46,6 +46,25 @@ def test_override_symlink(tmp_path: Path):
     assert test_file.is_symlink()
 
 
+def test_batch_symlinks(tmp_path: Path):
+    src_dir = tmp_path / "src"
+    src_dir.mkdir()
+    dest_dir = tmp_path / "dest"
+    dest_dir.mkdir()
+    (src_dir / "a").touch()
+    (src_dir / "b").touch()
+    # dangling link at destination should be replaced
+    os.symlink("missing", dest_dir / "c")
+    relsymlinks(
+        [
+            (src_dir / "a", dest_dir, None),
+            (src_dir / "b", dest_dir, "c"),
+        ]
+    )
+    assert os.readlink(dest_dir / "a") == "../src/a"
+    assert os.readlink(dest_dir / "c") == "../src/b"
+
+
 def test_create_component_symlinks_fails(data: Config, tmp_path: Path):
     component = Component("my-component", work_dir=tmp_path)
     with pytest.raises(FileNotFoundError):
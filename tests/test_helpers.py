@@ -1,6 +1,7 @@
 """
 Unit-tests for helpers
 """
+import os
 from pathlib import Path
 from typing import Callable
 import textwrap
@@ -134,3 +135,34 @@ def test_yaml_dump(tmp_path: Path, input, expected):
 )
 def test_yaml_dump_all(tmp_path: Path, input, expected):
     _test_yaml_dump_fun(helpers.yaml_dump_all, tmp_path, input, expected)
+
+
+@pytest.mark.parametrize(
+    "path,start",
+    [
+        ("/a/b/c", "/a/b"),
+        ("/a/b", "/a/b/c"),
+        ("/a/b", "/a/b"),
+        ("/a/x/y", "/a/b/c"),
+        ("/x", "/a/b"),
+        ("/a", "/"),
+        ("/a/../b", "/a/c"),
+        ("/a/./b", "/a//c"),
+        ("a/b", "/a"),
+    ],
+)
+def test_relpath(path, start):
+    assert helpers._relpath(path, start) == os.path.relpath(path, start=start)
+
+
+@pytest.mark.parametrize("reuse_inventory,reset", [(False, True), (True, False)])
+def test_kapitan_compile_reuse_inventory(
+    tmp_path: Path, monkeypatch, reuse_inventory, reset
+):
+    resets = []
+    monkeypatch.setattr("kapitan.cached.reset_cache", lambda: resets.append(True))
+    monkeypatch.setattr("kapitan.targets.compile_targets", lambda **kwargs: None)
+
+    helpers.kapitan_compile(Config(tmp_path), ["test"], reuse_inventory=reuse_inventory)
+
+    assert bool(resets) == reset